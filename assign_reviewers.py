@@ -1,5 +1,5 @@
 import csv
-import sys
+import argparse
 from math import ceil
 
 def assign_reviewers(input_file, output_file, reviewer_initials):
@@ -73,22 +73,26 @@ def assign_reviewers(input_file, output_file, reviewer_initials):
         count = end_idx - start_idx
         print(f"{initials}: {count} papers")
 
-def main():
-    if len(sys.argv) != 4:
-        print("Usage: python assign_reviewers.py <input_csv> <output_csv> <reviewer_initials>")
-        print("Example: python assign_reviewers.py papers.csv assigned_papers.csv DW,AA,JP,FS")
-        sys.exit(1)
-    
-    input_file = sys.argv[1]
-    output_file = sys.argv[2]
-    reviewer_initials = [initial.strip() for initial in sys.argv[3].split(',')]
+def add_arguments(parser):
+    parser.add_argument('input', help='Input CSV file path')
+    parser.add_argument('output', help='Output CSV file path')
+    parser.add_argument('reviewers', help='Comma-separated list of reviewer initials (e.g., DW,AA,JP,FS)')
+
+def run(args):
+    reviewer_initials = [initial.strip() for initial in args.reviewers.split(',')]
     
     try:
-        assign_reviewers(input_file, output_file, reviewer_initials)
+        assign_reviewers(args.input, args.output, reviewer_initials)
     except FileNotFoundError:
-        print(f"Error: Input file '{input_file}' not found.")
+        print(f"Error: Input file '{args.input}' not found.")
     except Exception as e:
         print(f"Error: {e}")
 
+def main():
+    parser = argparse.ArgumentParser(description='Assign papers marked as AI evenly to reviewers')
+    add_arguments(parser)
+    
+    run(parser.parse_args())
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
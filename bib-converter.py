@@ -2,6 +2,7 @@ import re
 import csv
 import sys
 import os
+import argparse
 
 def parse_bibtex_file(bib_file_path, output_csv_path):
     """
@@ -196,46 +197,46 @@ def parse_icse_year(year, output_csv_path):
     print(f"  AI: {len(ai_titles)} papers")
     print(f"Results saved to {output_csv_path}")
 
-def main():
-    if len(sys.argv) == 3:
-        # Original functionality: single BibTeX file
-        input_file = sys.argv[1]
-        output_filename = sys.argv[2]
-        output_file = os.path.join("results", "bib", output_filename)
-        
+def add_arguments(parser):
+    parser.add_argument('--icse', action='store_true', help='Treat source as an ICSE year and merge the artifact/AI exports from data/<year>/')
+    parser.add_argument('source', help='Input .bib file, or the year when --icse is given')
+    parser.add_argument('output', help='Output CSV filename (written under results/bib/)')
+
+def run(args):
+    output_file = os.path.join("results", "bib", args.output)
+    
+    if args.icse:
+        # ICSE year processing
         try:
-            parse_bibtex_file(input_file, output_file)
-        except FileNotFoundError:
-            print(f"Error: Could not find file '{input_file}'")
+            parse_icse_year(args.source, output_file)
+        except FileNotFoundError as e:
+            print(f"Error: {str(e)}")
             sys.exit(1)
         except Exception as e:
             print(f"Error: {str(e)}")
             sys.exit(1)
-    
-    elif len(sys.argv) == 4 and sys.argv[1] == "--icse":
-        # New functionality: ICSE year processing
-        year = sys.argv[2]
-        output_filename = sys.argv[3]
-        output_file = os.path.join("results", "bib", output_filename)
-        
+    else:
+        # Single BibTeX file
         try:
-            parse_icse_year(year, output_file)
-        except FileNotFoundError as e:
-            print(f"Error: {str(e)}")
+            parse_bibtex_file(args.source, output_file)
+        except FileNotFoundError:
+            print(f"Error: Could not find file '{args.source}'")
             sys.exit(1)
         except Exception as e:
             print(f"Error: {str(e)}")
             sys.exit(1)
-    
-    else:
-        print("Usage:")
-        print("  Single file: python bib-converter.py <input_bib_file> <output_csv_file>")
-        print("  ICSE year:   python bib-converter.py --icse <year> <output_csv_file>")
-        print("")
-        print("Examples:")
-        print("  python bib-converter.py all-keywords.bib papers.csv")
-        print("  python bib-converter.py --icse 2023 icse2023.csv")
-        sys.exit(1)
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Convert ACM BibTeX exports to CSV',
+        epilog='Examples:\n'
+               '  python bib-converter.py all-keywords.bib papers.csv\n'
+               '  python bib-converter.py --icse 2023 icse2023.csv',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    add_arguments(parser)
+    
+    run(parser.parse_args())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
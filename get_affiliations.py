@@ -1,7 +1,6 @@
-import requests
 import csv
 import time
-import sys
+import argparse
 from urllib.parse import urlparse
 
 def get_doi_from_url(url):
@@ -20,6 +19,8 @@ def get_doi_from_url(url):
 
 def fetch_metadata(doi):
     """Fetch JSON metadata from CrossRef for a DOI."""
+    import requests
+
     url = f"https://api.crossref.org/works/{doi}"
     headers = {"Accept": "application/json"}
     try:
@@ -52,13 +53,14 @@ def extract_authors(metadata):
             })
     return authors_data
 
-def main():
-    if len(sys.argv) != 3:
-        print("Usage: python fetch_acm_affiliations.py <input_csv_path> <output_csv_path>")
-        sys.exit(1)
+def get_affiliations(input_file, output_file):
+    """
+    Fetch CrossRef authors and affiliations for every paper in the input CSV.
 
-    input_file = sys.argv[1]
-    output_file = sys.argv[2]
+    Args:
+        input_file (str): Path to input CSV file
+        output_file (str): Path to output CSV file
+    """
     rows_out = []
 
     with open(input_file, newline="", encoding="utf-8") as csvfile:
@@ -97,5 +99,18 @@ def main():
 
     print(f"Done! Saved {len(rows_out)} author entries to {output_file}")
 
+def add_arguments(parser):
+    parser.add_argument('input', help='Input CSV file path')
+    parser.add_argument('output', help='Output CSV file path')
+
+def run(args):
+    get_affiliations(args.input, args.output)
+
+def main():
+    parser = argparse.ArgumentParser(description='Fetch author affiliations from CrossRef using paper DOIs')
+    add_arguments(parser)
+
+    run(parser.parse_args())
+
 if __name__ == "__main__":
     main()
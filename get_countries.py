@@ -1,12 +1,12 @@
-import pandas as pd
-import ollama
 import time
 import argparse
 from typing import Optional
 
 def extract_country_with_llm(affiliation: str, model: str = 'gemma3:4b') -> Optional[str]:
-    if pd.isna(affiliation) or not isinstance(affiliation, str):
+    if not isinstance(affiliation, str) or not affiliation:
         return None
+
+    import ollama
     
     prompt = f"""
     Get the country from this academic affiliation. Return only one country name, nothing else.
@@ -42,6 +42,7 @@ def process_affiliations_csv(input_file: str, output_file: str = None, model: st
     """
     Process CSV file to add country column using LLM extraction.
     """
+    import pandas as pd
 
     df = pd.read_csv(input_file)
     
@@ -84,15 +85,21 @@ def process_affiliations_csv(input_file: str, output_file: str = None, model: st
     
     return df
 
-def main():
-    parser = argparse.ArgumentParser(description='Extract countries from academic affiliations using local LLM')
+def add_arguments(parser):
     parser.add_argument('input', help='Input CSV file path')
     parser.add_argument('-o', '--output', help='Output CSV file path (optional)')
     parser.add_argument('--model', default='gemma3:4b', help='Ollama model to use (default: gemma3:4b)')
 
+def run(args):
+    process_affiliations_csv(args.input, args.output, args.model)
+
+def main():
+    parser = argparse.ArgumentParser(description='Extract countries from academic affiliations using local LLM')
+    add_arguments(parser)
+
     args = parser.parse_args()
     
-    process_affiliations_csv(args.input, args.output, args.model)
+    run(args)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,70 @@
+import argparse
+import importlib.util
+import os
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Subcommand -> (script it wraps, help text). The scripts own their arguments
+# and are only loaded for the subcommand being run.
+SUBCOMMANDS = {
+    'scrape': ('scraper.py', 'Scrape papers from a Researchr track page'),
+    'convert': ('bib-converter.py', 'Convert ACM BibTeX exports to CSV'),
+    'assign': ('assign_reviewers.py', 'Assign AI papers evenly to reviewers'),
+    'affiliations': ('get_affiliations.py', 'Fetch author affiliations from CrossRef'),
+    'countries': ('get_countries.py', 'Extract countries from affiliations using a local LLM'),
+    'reconcile': ('reconcile.py', 'Reconcile a Researchr scrape with an ACM BibTeX conversion'),
+}
+
+def load_script(filename):
+    """
+    Import one of the pipeline scripts by path.
+
+    Scripts are only loaded once their subcommand is selected, and keep their
+    heavy dependencies (requests, bs4, pandas, ollama) inside the functions
+    that use them, so --help and the stdlib-only CSV/BibTeX steps never
+    import them.
+    """
+    name = 'paperfilter._scripts.' + os.path.splitext(filename)[0].replace('-', '_')
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, os.path.join(SCRIPT_DIR, filename))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+def build_parser(command=None):
+    """
+    Build the CLI parser, filling in the arguments of the selected subcommand only.
+    """
+    parser = argparse.ArgumentParser(prog='paperfilter', description='Fetch and process papers from the ICSE Research Track')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    for name, (filename, help_text) in SUBCOMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        if name == command:
+            script = load_script(filename)
+            script.add_arguments(subparser)
+            subparser.set_defaults(func=script.run)
+
+    return parser
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    # The subcommand is the first positional, as the top-level parser has no other options
+    command = next((arg for arg in argv if not arg.startswith('-')), None)
+    args = build_parser(command).parse_args(argv)
+    try:
+        args.func(args)
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
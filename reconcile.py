@@ -0,0 +1,333 @@
+import csv
+import os
+import re
+import sys
+import html
+import argparse
+import unicodedata
+
+# A capitalized word glued onto the previous one near the end of a title, e.g.
+# "...SystemsSecurity", as left by Researchr badges in older scrapes
+GLUED_SUFFIX = re.compile(r'[a-z0-9?!.)][A-Z]\w*(?: \w+){0,2}$')
+
+# A LaTeX escape left open at the end of a value, e.g. 'Stegh\"{o', where
+# bib-converter's regex stopped at the escape's closing brace
+LATEX_CUTOFF = re.compile(r'\\\S*$')
+
+def normalize_text(text):
+    """
+    Lowercase, unescape HTML entities, strip accents and punctuation, and collapse whitespace.
+    """
+    text = unicodedata.normalize('NFKD', html.unescape(text or ''))
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    return ' '.join(re.sub(r'[\W_]+', ' ', text.casefold()).split())
+
+def title_key(title):
+    """
+    Join key for a title: its normalized text with all spacing removed.
+    """
+    return normalize_text(title).replace(' ', '')
+
+def split_authors(authors, researchr):
+    """
+    Split an author list into one string per author.
+
+    Researchr lists authors as "First Last,First Last" while the BibTeX
+    export gives "Last, First, Last, First".
+    """
+    parts = [part.strip() for part in (authors or '').split(',')]
+    if researchr:
+        return [part for part in parts if part]
+    return [', '.join(parts[k:k + 2]) for k in range(0, len(parts), 2) if parts[k]]
+
+def normalize_authors(authors, researchr):
+    """
+    Reduce an author list to an in-order list of per-author name token sets.
+
+    Each author is a set of tokens since the two sources order first and
+    last names differently. Single-letter tokens are dropped from each name,
+    since middle initials are often given by only one of the sources.
+    """
+    return [frozenset(token for token in normalize_text(name).split() if len(token) > 1)
+            for name in split_authors(authors, researchr)]
+
+def to_bib_authors(authors):
+    """
+    Convert a Researchr author list to the BibTeX export's "Last, First, Last, First" form.
+
+    The surname is the last word plus any lowercase particles before it
+    (e.g. "André van der Hoek" becomes "van der Hoek, André").
+    """
+    names = []
+    for name in split_authors(authors, researchr=True):
+        words = name.split()
+        start = len(words) - 1
+        while start > 1 and words[start - 1][:1].islower():
+            start -= 1
+        names.append(f"{' '.join(words[start:])}, {' '.join(words[:start])}" if start > 0 else name)
+    return ', '.join(names)
+
+def is_truncated(bib_value):
+    """
+    Whether a BibTeX value was cut short at a LaTeX escape by the converter.
+    """
+    return bool(LATEX_CUTOFF.search(bib_value))
+
+def read_papers(csv_path):
+    """
+    Read a papers CSV and return its rows sorted by title key.
+
+    Files already in key order (e.g. a previous merged output) are checked in
+    one pass and not re-sorted; otherwise sorting is the O(n log n) step of
+    the reconciliation, and the merge itself is linear.
+    """
+    with open(csv_path, 'r', newline='', encoding='utf-8') as csvfile:
+        reader = csv.DictReader(csvfile)
+        papers = [row for row in reader if row.get('title')]
+    for paper in papers:
+        paper['key'] = title_key(paper['title'])
+    if any(papers[k]['key'] > papers[k + 1]['key'] for k in range(len(papers) - 1)):
+        papers.sort(key=lambda paper: paper['key'])
+    return papers
+
+def diff_fields(researchr_paper, bib_paper):
+    """
+    Compare the fields both sources provide and return the ones that disagree.
+    """
+    diffs = []
+    if normalize_text(researchr_paper['title']) != normalize_text(bib_paper['title']):
+        diffs.append(('title', researchr_paper['title'], bib_paper['title']))
+    if normalize_authors(researchr_paper['authors'], researchr=True) != normalize_authors(bib_paper['authors'], researchr=False):
+        diffs.append(('authors', researchr_paper['authors'], bib_paper['authors']))
+    return diffs
+
+def titles_similar(researchr_paper, bib_paper):
+    """
+    Whether two titles look like the same paper under a revised title.
+
+    Either their keys share a prefix covering at least half of the shorter
+    key (subtitles or badges added or dropped), or at least half of their
+    words overlap (words inserted or changed).
+    """
+    key_a, key_b = researchr_paper['key'], bib_paper['key']
+    shorter = min(len(key_a), len(key_b))
+    prefix = 0
+    while prefix < shorter and key_a[prefix] == key_b[prefix]:
+        prefix += 1
+    if shorter >= 8 and prefix * 2 >= shorter:
+        return True
+
+    words_a = set(normalize_text(researchr_paper['title']).split())
+    words_b = set(normalize_text(bib_paper['title']).split())
+    return len(words_a & words_b) * 2 >= len(words_a | words_b)
+
+def surname_key(paper, researchr):
+    """
+    Secondary join key: the in-order tuple of author surnames.
+    """
+    surnames = []
+    for name in split_authors(paper['authors'], researchr):
+        # Researchr gives "First Last", the BibTeX export "Last, First"
+        tokens = normalize_text(name if researchr else name.split(',')[0]).split()
+        if tokens:
+            surnames.append(tokens[-1])
+    return tuple(surnames)
+
+def authors_agree(researchr_paper, bib_paper):
+    """
+    Whether two papers plausibly have the same authors.
+
+    Either their in-order surnames match, or more than half of the authors
+    share a name token with the author at the same position in the other list.
+    A BibTeX list cut off at a LaTeX escape is compared on what is left of it.
+    """
+    researchr_surnames = surname_key(researchr_paper, researchr=True)
+    if researchr_surnames and researchr_surnames == surname_key(bib_paper, researchr=False):
+        return True
+
+    researchr_authors = normalize_authors(researchr_paper['authors'], researchr=True)
+    bib_authors = normalize_authors(bib_paper['authors'], researchr=False)
+    if LATEX_CUTOFF.search(bib_paper['authors']) and 0 < len(bib_authors) <= len(researchr_authors):
+        # Every complete author must agree, and what is left of the cut-off last name (if
+        # anything beyond an initial) must start one of the Researchr names at that position
+        *complete, partial = bib_authors
+        return (all(researchr_name & bib_name for researchr_name, bib_name in zip(researchr_authors, complete))
+                and (not partial or any(name.startswith(token) for token in partial for name in researchr_authors[len(complete)])))
+    shared = sum(1 for researchr_name, bib_name in zip(researchr_authors, bib_authors) if researchr_name & bib_name)
+    return shared * 2 > max(len(researchr_authors), len(bib_authors))
+
+def pair_unmatched(steps):
+    """
+    Pair up missing and extra papers whose titles changed between the two sources.
+
+    Unmatched papers are already in key order, so a revised title usually sits
+    right next to its counterpart: neighbouring missing/extra papers with
+    similar titles and agreeing authors are paired first. Papers still unmatched are then paired
+    through a hash on their author surnames. Both passes are linear.
+
+    The bib paper of a pair is moved into the researchr step, and the step it
+    came from is left empty.
+    """
+    unmatched = [step for step in steps if step['researchr'] is None or step['bib'] is None]
+
+    pending = None
+    for step in unmatched:
+        if pending and (pending['researchr'] is None) != (step['researchr'] is None):
+            missing, extra = (pending, step) if pending['bib'] is None else (step, pending)
+            if titles_similar(missing['researchr'], extra['bib']) and authors_agree(missing['researchr'], extra['bib']):
+                missing['bib'], extra['bib'] = extra['bib'], None
+                missing['paired'] = True
+                pending = None
+                continue
+        pending = step
+
+    extras_by_authors = {}
+    for step in unmatched:
+        if step['researchr'] is None and step['bib'] is not None:
+            key = surname_key(step['bib'], researchr=False)
+            if key:
+                extras_by_authors.setdefault(key, []).append(step)
+    for step in unmatched:
+        if step['bib'] is None and step['researchr'] is not None:
+            candidates = extras_by_authors.get(surname_key(step['researchr'], researchr=True), [])
+            extra = next((candidate for candidate in candidates if candidate['bib'] is not None), None)
+            if extra:
+                step['bib'], extra['bib'] = extra['bib'], None
+                step['paired'] = True
+
+def reconcile(researchr_papers, bib_papers):
+    """
+    Sort-merge join two title-sorted paper lists on their normalized key.
+
+    Args:
+        researchr_papers (list): Rows from a PaperScraper CSV, sorted by key
+        bib_papers (list): Rows from a parse_icse_year CSV, sorted by key
+
+    Returns:
+        tuple: (merged records, discrepancy rows)
+    """
+    steps = []
+    i = j = 0
+
+    while i < len(researchr_papers) or j < len(bib_papers):
+        researchr_key = researchr_papers[i]['key'] if i < len(researchr_papers) else None
+        bib_key = bib_papers[j]['key'] if j < len(bib_papers) else None
+
+        if bib_key is None or (researchr_key is not None and researchr_key < bib_key):
+            steps.append({'researchr': researchr_papers[i], 'bib': None})
+            i += 1
+        elif researchr_key is None or bib_key < researchr_key:
+            steps.append({'researchr': None, 'bib': bib_papers[j]})
+            j += 1
+        else:
+            steps.append({'researchr': researchr_papers[i], 'bib': bib_papers[j]})
+            i += 1
+            j += 1
+
+    pair_unmatched(steps)
+
+    merged = []
+    discrepancies = []
+    for step in steps:
+        researchr_paper, bib_paper = step['researchr'], step['bib']
+        if researchr_paper and bib_paper:
+            # Keys match or the titles were paired: the ACM export is authoritative unless its value was
+            # cut short, and disagreements it cannot settle are flagged as conflicts
+            if step.get('paired') and GLUED_SUFFIX.search(researchr_paper['title']):
+                print(f"Warning: Researchr title '{researchr_paper['title']}' has no exact match and may carry a badge")
+            record = {k: v for k, v in bib_paper.items() if k != 'key'}
+            for field in ('title', 'authors'):
+                if not record.get(field):
+                    record[field] = researchr_paper[field]
+            conflicts = []
+            for field, researchr_value, bib_value in diff_fields(researchr_paper, bib_paper):
+                discrepancies.append({'status': 'mismatch', 'title': bib_paper['title'], 'field': field,
+                                      'researchr_value': researchr_value, 'bib_value': bib_value})
+                if is_truncated(bib_value):
+                    record[field] = to_bib_authors(researchr_value) if field == 'authors' else researchr_value
+                else:
+                    conflicts.append(field)
+            record['source'] = 'both'
+            record['conflicts'] = ';'.join(conflicts)
+            merged.append(record)
+        elif researchr_paper:
+            # Listed on Researchr but absent from the ACM export
+            if GLUED_SUFFIX.search(researchr_paper['title']):
+                print(f"Warning: Researchr title '{researchr_paper['title']}' has no match and may carry a badge")
+            merged.append({'title': researchr_paper['title'], 'authors': to_bib_authors(researchr_paper['authors']),
+                           'source': 'researchr'})
+            discrepancies.append({'status': 'missing', 'title': researchr_paper['title'], 'field': '',
+                                  'researchr_value': '', 'bib_value': ''})
+        elif bib_paper:
+            # In the ACM export but not in the Researchr track
+            merged.append({**{k: v for k, v in bib_paper.items() if k != 'key'}, 'source': 'bib'})
+            discrepancies.append({'status': 'extra', 'title': bib_paper['title'], 'field': '',
+                                  'researchr_value': '', 'bib_value': ''})
+
+    return merged, discrepancies
+
+def write_csv(rows, output_csv_path, fieldnames):
+    output_dir = os.path.dirname(output_csv_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    with open(output_csv_path, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, restval='')
+        writer.writeheader()
+        writer.writerows(rows)
+
+def reconcile_files(researchr_csv_path, bib_csv_path, output_csv_path, report_csv_path=None):
+    """
+    Reconcile a Researchr scrape with an ACM BibTeX conversion for the same track.
+
+    Writes the merged record set to output_csv_path and, if given, the
+    missing/extra/mismatch report to report_csv_path.
+
+    Returns:
+        list: Discrepancy rows
+    """
+    researchr_papers = read_papers(researchr_csv_path)
+    bib_papers = read_papers(bib_csv_path)
+    merged, discrepancies = reconcile(researchr_papers, bib_papers)
+
+    bib_fields = [field for field in (bib_papers[0] if bib_papers else {'title': '', 'authors': ''}) if field != 'key']
+    write_csv(merged, output_csv_path, bib_fields + ['source', 'conflicts'])
+    if report_csv_path:
+        write_csv(discrepancies, report_csv_path, ['status', 'title', 'field', 'researchr_value', 'bib_value'])
+
+    counts = {status: sum(1 for d in discrepancies if d['status'] == status) for status in ('missing', 'extra', 'mismatch')}
+    print(f"Reconciled {len(researchr_papers)} Researchr papers with {len(bib_papers)} BibTeX papers")
+    print(f"  Missing from BibTeX: {counts['missing']}")
+    print(f"  Extra in BibTeX: {counts['extra']}")
+    print(f"  Field mismatches: {counts['mismatch']}")
+    for d in discrepancies:
+        if d['status'] == 'mismatch':
+            print(f"  [{d['status']}] {d['title']} ({d['field']}): {d['researchr_value']!r} != {d['bib_value']!r}")
+        else:
+            print(f"  [{d['status']}] {d['title']}")
+    print(f"Merged records saved to {output_csv_path}")
+    if report_csv_path:
+        print(f"Report saved to {report_csv_path}")
+
+    return discrepancies
+
+def add_arguments(parser):
+    parser.add_argument('researchr', help='Researchr CSV path (e.g., results/researchr/2025_papers.csv)')
+    parser.add_argument('bib', help='BibTeX CSV path (e.g., results/bib/ICSE2025_papers.csv)')
+    parser.add_argument('output', help='Merged output CSV path')
+    parser.add_argument('-r', '--report', help='Discrepancy report CSV path (optional)')
+    parser.add_argument('--strict', action='store_true', help='Exit with status 1 if any discrepancy is found')
+
+def run(args):
+    discrepancies = reconcile_files(args.researchr, args.bib, args.output, args.report)
+    if args.strict and discrepancies:
+        sys.exit(1)
+
+def main():
+    parser = argparse.ArgumentParser(description='Reconcile Researchr scrapes with ACM BibTeX conversions')
+    add_arguments(parser)
+
+    run(parser.parse_args())
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,5 @@
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+import re
+import csv
 import time
 import json
 from urllib.parse import urljoin, urlparse
@@ -21,6 +20,8 @@ class PaperScraper:
             base_url (str): The website URL to scrape
             delay (int): Delay between requests in seconds
         """
+        import requests
+
         self.base_url = base_url
         self.session = requests.Session()
         self.session.headers.update({
@@ -38,6 +39,9 @@ class PaperScraper:
         Returns:
             BeautifulSoup object or None if failed
         """
+        import requests
+        from bs4 import BeautifulSoup
+
         try:
             logger.info(f"Fetching: {url}")
             response = self.session.get(url, timeout=2)
@@ -72,7 +76,11 @@ class PaperScraper:
                 paper_content.find('a')
             )
             if title_elem:
-                paper_info['title'] = title_elem.get_text(strip=True)
+                # Track badges (e.g. "Security", "Award Winner") are label elements nested in the link;
+                # drop them but keep any other inline markup (<em>, <sub>, ...) that is part of the title
+                for badge in title_elem.find_all(class_=re.compile(r'\b(label|badge)\b')):
+                    badge.decompose()
+                paper_info['title'] = ' '.join(title_elem.get_text().split())
             
             # Authors are in a div with class 'performers'
             authors_elem = (
@@ -130,8 +138,10 @@ class PaperScraper:
         """Save scraped papers to CSV file"""
         os.makedirs('results/researchr', exist_ok=True)
         if self.papers:
-            df = pd.DataFrame(self.papers)
-            df.to_csv(f"results/researchr/{filename}", index=False)
+            with open(f"results/researchr/{filename}", 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=['title', 'authors'])
+                writer.writeheader()
+                writer.writerows(self.papers)
             logger.info(f"Saved {len(self.papers)} papers to results/researchr/{filename}")
         else:
             logger.warning("No papers to save")
@@ -146,13 +156,19 @@ class PaperScraper:
         else:
             logger.warning("No papers to save")
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description='Scrape academic papers from a conference website')
+def add_arguments(parser):
     parser.add_argument('url', help='Target website URL to scrape')
     parser.add_argument('year', help='Year of the conference (e.g., 2023)')
+
+def run(args):
+    scraper = PaperScraper(args.url)
+    scraper.scrape_papers()
+    scraper.save_to_csv(f"{args.year}_papers.csv")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Scrape academic papers from a conference website')
+    add_arguments(parser)
     
     args = parser.parse_args()
     
-    scraper = PaperScraper(args.url)
-    scraper.scrape_papers()
-    scraper.save_to_csv(f"{args.year}_papers.csv")
\ No newline at end of file
+    run(args)
\ No newline at end of file
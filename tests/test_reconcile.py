@@ -0,0 +1,68 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reconcile import reconcile, title_key
+
+def make_papers(*papers):
+    papers = [dict(paper, key=title_key(paper['title'])) for paper in papers]
+    return sorted(papers, key=lambda paper: paper['key'])
+
+def test_similar_titles_with_different_authors_stay_unmatched():
+    researchr_papers = make_papers(
+        {'title': 'Large Language Models for Code Review', 'authors': 'Alice Smith,Bob Jones'},
+    )
+    bib_papers = make_papers(
+        {'title': 'Large Language Models for Test Generation', 'authors': 'Wu, Wei'},
+    )
+
+    merged, discrepancies = reconcile(researchr_papers, bib_papers)
+
+    assert sorted(d['status'] for d in discrepancies) == ['extra', 'missing']
+    assert sorted(record['title'] for record in merged) == [
+        'Large Language Models for Code Review',
+        'Large Language Models for Test Generation',
+    ]
+
+def test_revised_title_with_same_authors_is_paired():
+    researchr_papers = make_papers(
+        {'title': 'Prompting Is All Your Need: Automated Android Bug Replay', 'authors': 'Alice Smith,Bob Jones'},
+    )
+    bib_papers = make_papers(
+        {'title': 'Prompting Is All You Need: Automated Android Bug Replay', 'authors': 'Smith, Alice, Jones, Bob'},
+    )
+
+    merged, discrepancies = reconcile(researchr_papers, bib_papers)
+
+    assert [(d['status'], d['field']) for d in discrepancies] == [('mismatch', 'title')]
+    assert len(merged) == 1
+
+def test_revised_title_with_truncated_bib_authors_is_paired():
+    researchr_papers = make_papers(
+        {'title': 'Reachable Coverage in FuzzingSecurity', 'authors': 'Alice Smith,Bob Jones,Marcel Böhme'},
+    )
+    bib_papers = make_papers(
+        {'title': 'Reachable Coverage in Fuzzing', 'authors': 'Smith, Alice, Jones, Bob, B\\"{o'},
+    )
+
+    merged, discrepancies = reconcile(researchr_papers, bib_papers)
+
+    assert [(d['status'], d['field']) for d in discrepancies] == [('mismatch', 'title'), ('mismatch', 'authors')]
+    assert len(merged) == 1
+
+def test_merged_authors_use_bib_format():
+    researchr_papers = make_papers(
+        {'title': 'Analyzing the Impact of Workloads', 'authors': 'Stefan Mühlbauer,André van der Hoek'},
+        {'title': 'A Researchr-Only Keynote', 'authors': 'Alice Smith'},
+    )
+    bib_papers = make_papers(
+        {'title': 'Analyzing the Impact of Workloads', 'authors': 'M\\"{u'},
+    )
+
+    merged, _ = reconcile(researchr_papers, bib_papers)
+
+    assert [record['authors'] for record in merged] == [
+        'Mühlbauer, Stefan, van der Hoek, André',
+        'Smith, Alice',
+    ]